@@ -1,4 +1,9 @@
+import time
 import redis
+import online.common.review_redis_common_schema as review_redis_common_schema
+
+PURGE_BATCH_SIZE = 500  # SCAN count 겸 UNLINK 배치 크기
+PURGE_THROTTLE_MS = 10  # 배치 사이 대기 (Redis 점유 방지)
 
 def init_redis(host, port, db):
     client = redis.StrictRedis(host=host, port=port, db=db, decode_responses=True)
@@ -8,3 +13,35 @@ def flush_db(db):
 
     client = init_redis(host='localhost', port=6379, db=db)
     client.flushdb()
+
+def escape_glob(value: str) -> str:
+    """SCAN MATCH 패턴에서 문자 그대로 쓰이도록 glob 특수문자(* ? [ ] \\) 이스케이프"""
+    return "".join("\\" + c if c in "*?[]\\" else c for c in value)
+
+def purge_channel(channel_name: str, db, batch_size: int = PURGE_BATCH_SIZE,
+                  throttle_ms: int = PURGE_THROTTLE_MS, progress=print) -> int:
+    """
+    channel_name의 review 키와 채널 인덱스만 삭제 (다른 채널은 유지)
+    - FLUSHDB 대신 SCAN + UNLINK를 배치로 수행해 Redis를 블로킹하지 않음
+    - 채널명의 glob 특수문자는 이스케이프되어 다른 채널의 키와 매칭되지 않음
+    - 배치마다 progress("purge channel=... deleted=N") 로 진행 상황 보고 (None이면 보고하지 않음)
+    - 반환: 삭제한 review 키 수
+    """
+    client = init_redis(host='localhost', port=6379, db=db)
+    match = f"{review_redis_common_schema.KEY_PREFIX}:{escape_glob(channel_name)}:*"
+
+    # 채널 시간 인덱스 (sorted set)를 먼저 UNLINK → 삭제 중 인덱스가 없는 hash를 가리키지 않음
+    client.unlink(review_redis_common_schema.index_key(channel_name))
+
+    cursor, deleted = 0, 0
+    while True:
+        cursor, keys = client.scan(cursor=cursor, match=match, count=batch_size)
+        if keys:
+            deleted += client.unlink(*keys)
+            if progress:
+                progress(f"purge channel={channel_name} deleted={deleted}")
+        if cursor == 0:
+            break
+        time.sleep(throttle_ms / 1000.0)
+
+    return deleted
@@ -1,5 +1,6 @@
 import redis
 import online.common.review_redis_common_insert_dto as review_redis_common_insert_dto
+import online.common.review_redis_common_schema as review_redis_common_schema
 
 def init_redis(host, port, db):
     client = redis.StrictRedis(host=host, port=port, db=db, decode_responses=True)
@@ -18,11 +19,8 @@ def insert_review(review_data: review_redis_common_insert_dto, db):
     #✅forDebug
     #print(review_data)
 
-    # Redis key 생성
-    key = f"review:{review_data.channel_name}:{review_data.review_created_at}"
-
-    # JSON mapping
-    result = client.hmset(key, mapping = {
+    # v2 스키마로 정규화 (epoch 초 / 숫자 필드)
+    mapping = review_redis_common_schema.to_mapping({
         "channel_name": review_data.channel_name,
         "original_id": review_data.original_id,
         "original_created_at": review_data.original_created_at,
@@ -36,6 +34,15 @@ def insert_review(review_data: review_redis_common_insert_dto, db):
         "review_created_at": review_data.review_created_at,
         "inserted_at": review_data.inserted_at,
     })
+
+    # Redis key 생성
+    key = review_redis_common_schema.review_key(review_data.channel_name, mapping["review_created_at"])
+
+    # hash 저장 + 채널 시간 인덱스 갱신
+    pipe = client.pipeline()
+    pipe.hset(key, mapping=mapping)
+    pipe.zadd(review_redis_common_schema.index_key(review_data.channel_name), {key: mapping["review_created_at"]})
+    result = pipe.execute()
     
     print("저장 결과:", result)
     return key
\ No newline at end of file
@@ -10,7 +10,7 @@ class review_redis_common_insert_dto:
     reviewer_name: str
     rating: int
     review_content: str
-    views: str
-    like : str
-    review_created_at: str
-    inserted_at: str
\ No newline at end of file
+    views: int
+    like : int
+    review_created_at: int  # epoch 초
+    inserted_at: int        # epoch 초
\ No newline at end of file
@@ -0,0 +1,117 @@
+import time
+import redis
+import online.common.review_redis_common_schema as review_redis_common_schema
+
+DB = 0
+BATCH_SIZE = 500    # SCAN count 겸 파이프라인 배치 크기
+THROTTLE_MS = 10    # 배치 사이 대기 (운영 트래픽 보호)
+
+def init_redis(host, port, db):
+    client = redis.StrictRedis(host=host, port=port, db=db, decode_responses=True)
+    return client
+
+# 키 하나를 원자적으로 확인 후 재작성
+# KEYS: [기존 키, v2 키, 채널 인덱스]  ARGV: [schema_version, score, field1, value1, ...]
+# - 읽은 뒤 insert_review가 v2로 덮어쓴 키(기존/새 키 모두)는 건드리지 않음 → 0
+MIGRATE_KEY_LUA = """
+if redis.call('HGET', KEYS[1], 'schema_version') == ARGV[1] then
+    return 0
+end
+if KEYS[1] ~= KEYS[2] and redis.call('HGET', KEYS[2], 'schema_version') == ARGV[1] then
+    redis.call('UNLINK', KEYS[1])
+    return 0
+end
+redis.call('HSET', KEYS[2], unpack(ARGV, 3))
+redis.call('ZADD', KEYS[3], ARGV[2], KEYS[2])
+if KEYS[1] ~= KEYS[2] then
+    redis.call('UNLINK', KEYS[1])
+end
+return 1
+"""
+
+def _migrate_batch(client, keys: list[str]) -> tuple[int, int, set[str]]:
+    """
+    keys를 v2 스키마로 재작성. 반환: (migrated, skipped, 배치에 포함된 채널)
+    - 이미 v2이거나 hash가 아닌 키는 건너뜀
+    - v1 키 이름이 v2 형식(review:{channel}:{YYYYMMDDHHMMSS})과 다르면 새 키로 옮김
+    - 재작성은 키마다 Lua 스크립트로 원자적으로 수행되어, 읽은 뒤 들어온 insert를 덮어쓰지 않음
+    """
+    read = client.pipeline(transaction=False)
+    for k in keys:
+        read.hgetall(k)
+    values = read.execute(raise_on_error=False)
+
+    migrate_key = client.register_script(MIGRATE_KEY_LUA)
+    write = client.pipeline(transaction=False)
+    migrated, skipped = 0, 0
+    channels = {k.split(":", 2)[1] for k in keys if k.count(":") >= 2}
+    queued: list[str] = []
+    for k, v in zip(keys, values):
+        if isinstance(v, Exception) or not v:
+            skipped += 1
+            continue
+        if str(v.get("schema_version")) == str(review_redis_common_schema.SCHEMA_VERSION):
+            skipped += 1
+            continue
+
+        channel = v.get("channel_name") or k.split(":", 2)[1]
+        mapping = review_redis_common_schema.to_mapping({**v, "channel_name": channel})
+        if not mapping["review_created_at"]:
+            # 키의 시각 부분으로 보정
+            mapping["review_created_at"] = review_redis_common_schema.to_epoch(k.split(":", 2)[-1])
+        if not mapping["review_created_at"]:
+            skipped += 1
+            continue
+
+        new_key = review_redis_common_schema.review_key(channel, mapping["review_created_at"])
+        args = [review_redis_common_schema.SCHEMA_VERSION, mapping["review_created_at"]]
+        for field, value in mapping.items():
+            args.extend([field, value])
+        migrate_key(keys=[k, new_key, review_redis_common_schema.index_key(channel)], args=args, client=write)
+        queued.append(k)
+    # 읽은 뒤 타입이 바뀐 키 등은 WRONGTYPE → 해당 키만 건너뛰고 계속 진행
+    for k, result in zip(queued, write.execute(raise_on_error=False)):
+        if isinstance(result, Exception):
+            print(f"migrate error key={k} : {result}")
+            skipped += 1
+        elif result == 1:
+            migrated += 1
+        else:
+            skipped += 1
+    return migrated, skipped, channels
+
+def migrate(db, batch_size: int = BATCH_SIZE, throttle_ms: int = THROTTLE_MS):
+    """
+    review:* 키를 SCAN으로 순회하며 배치 단위로 v2 스키마로 재작성 (서비스 중단 없이 수행)
+    - 키마다 원자적으로 적용되어 조회 중인 대시보드가 반쯤 바뀐 hash를 보지 않고,
+      동시에 실행 중인 insert_review의 v2 쓰기를 덮어쓰지 않음
+    - 재실행해도 안전 (v2 키는 건너뜀)
+    - 전체 순회가 끝나면 채널마다 review_idx_ready:{channel}을 기록 → 대시보드가 인덱스 조회로 전환
+    """
+    client = init_redis(host='localhost', port=6379, db=db)
+
+    cursor, total_migrated, total_skipped = 0, 0, 0
+    channels: set[str] = set()
+    while True:
+        cursor, keys = client.scan(cursor=cursor, match=f"{review_redis_common_schema.KEY_PREFIX}:*", count=batch_size)
+        if keys:
+            migrated, skipped, batch_channels = _migrate_batch(client, keys)
+            channels |= batch_channels
+            total_migrated += migrated
+            total_skipped += skipped
+            print(f"migrated={total_migrated} skipped={total_skipped}")
+        if cursor == 0:
+            break
+        time.sleep(throttle_ms / 1000.0)
+
+    # 순회 중 새로 들어온 키는 insert_review가 이미 v2 + 인덱스로 저장하므로 이 시점에 인덱스는 완전함
+    for ch in sorted(channels):
+        client.set(review_redis_common_schema.index_ready_key(ch), review_redis_common_schema.SCHEMA_VERSION)
+        print(f"index ready channel={ch}")
+
+    return total_migrated, total_skipped
+
+if __name__ == "__main__":
+    print(f"start migrate db={DB} -> schema v{review_redis_common_schema.SCHEMA_VERSION}")
+    migrated, skipped = migrate(DB)
+    print(f"migrate success db={DB} migrated={migrated} skipped={skipped}")
@@ -0,0 +1,68 @@
+import re
+from datetime import datetime
+
+# 저장 스키마 버전
+# v1: 시각 필드를 문자열(%Y%m%d%H%M%S 등)로 저장, rating/like 문자열 혼재
+# v2: 시각 필드는 epoch 초(int), 숫자 필드는 int로 통일
+SCHEMA_VERSION = 2
+
+KEY_PREFIX = "review"
+INDEX_PREFIX = "review_idx"  # 채널별 sorted set (score = review_created_at epoch)
+INDEX_READY_PREFIX = "review_idx_ready"  # 마이그레이션 완료 표시 (이후 대시보드가 인덱스로 조회)
+KEY_TIME_FORMAT = "%Y%m%d%H%M%S"
+
+TIME_FIELDS = ("review_created_at", "inserted_at")
+INT_FIELDS = ("rating", "like", "views")
+
+def review_key(channel_name: str, review_created_at: int) -> str:
+    """review:{channel}:{YYYYMMDDHHMMSS} (대시보드의 접두사 조회를 위해 키 형식은 유지)"""
+    ts = datetime.fromtimestamp(int(review_created_at)).strftime(KEY_TIME_FORMAT)
+    return f"{KEY_PREFIX}:{channel_name}:{ts}"
+
+def index_key(channel_name: str) -> str:
+    return f"{INDEX_PREFIX}:{channel_name}"
+
+def index_ready_key(channel_name: str) -> str:
+    return f"{INDEX_READY_PREFIX}:{channel_name}"
+
+def to_epoch(value) -> int:
+    """
+    datetime / epoch(s: 10자리, ms: 13자리) / v1 문자열 시각을 epoch 초로 변환
+    - %Y%m%d%H%M%S, %Y%m%d%H%M%S%f, %Y-%m-%dT%H:%M:%S, %Y-%m-%d %H:%M:%S, %Y%m%d 모두 처리
+    - 변환할 수 없으면 0
+    """
+    if value is None or value == "":
+        return 0
+    if isinstance(value, datetime):
+        return int(value.timestamp())
+    if isinstance(value, float):
+        value = int(value)
+    raw = str(value).strip()
+    if raw.isdigit() and len(raw) == 10:
+        return int(raw)
+    if raw.isdigit() and len(raw) == 13:
+        return int(raw) // 1000
+    # 날짜 문자열: 숫자만 모아 YYYYMMDD[HHMMSS]로 해석 (시각이 없으면 00:00:00)
+    digits = "".join(re.findall(r"\d", raw))
+    if len(digits) < 8:
+        return 0
+    try:
+        return int(datetime.strptime(digits[:14].ljust(14, "0"), KEY_TIME_FORMAT).timestamp())
+    except ValueError:
+        return 0
+
+def to_int(value) -> int:
+    try:
+        return int(float(value))
+    except (TypeError, ValueError):
+        return 0
+
+def to_mapping(fields: dict) -> dict:
+    """리뷰 필드를 v2 스키마의 Redis hash mapping으로 정규화"""
+    out = {k: ("" if v is None else v) for k, v in fields.items()}
+    for f in TIME_FIELDS:
+        out[f] = to_epoch(out.get(f))
+    for f in INT_FIELDS:
+        out[f] = to_int(out.get(f))
+    out["schema_version"] = SCHEMA_VERSION
+    return out
@@ -5,3 +5,6 @@ MNT_PLS_URL = "https://play.google.com/store/apps/details?id=world.mnetplus"
 # review count
 MAX_PAGES  = 500 
 REVIEW_CNT = 200 # google play에서 지정하는 최대 숫자
+
+# record & replay (부하 테스트용 scraper page 기록 위치)
+RECORD_DIR = "records/google_play"
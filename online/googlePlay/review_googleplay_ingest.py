@@ -0,0 +1,29 @@
+from datetime import datetime
+import online.common.review_redis_common_insert as review_redis_common_insert
+from online.common.review_redis_common_insert_dto import review_redis_common_insert_dto
+
+CHANNEL_NAME = "google_play"
+
+def to_review_data(item: dict) -> review_redis_common_insert_dto:
+    """google_play_scraper.reviews 결과 item → review_redis_common_insert_dto"""
+    return review_redis_common_insert_dto(
+        channel_name        = CHANNEL_NAME,
+        original_id         = "",
+        original_created_at = "",
+        original_content    = item.get("reviewCreatedVersion", ""),
+        review_id           = item.get("reviewId", ""), 
+        reviewer_name       = item.get("userName", ""),      
+        rating              = int(item.get("score", 0)),          
+        review_content      = (item.get("content") or "").strip(),
+        views               = 0,
+        like                = int(item.get("thumbsUpCount") or 0),   
+        review_created_at   = int(item["at"].timestamp()),
+        inserted_at         = int(datetime.now().timestamp())
+    )
+
+def ingest_item(item: dict, db) -> str:
+    """item 하나를 Redis에 저장하고 key 반환 (initial / scrap / replay 공통 경로)"""
+    return review_redis_common_insert.insert_review(to_review_data(item), db)
+
+def ingest_page(items: list[dict], db) -> list[str]:
+    return [ingest_item(item, db) for item in items]
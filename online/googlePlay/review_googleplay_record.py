@@ -0,0 +1,98 @@
+import os
+import json
+import time
+import argparse
+from datetime import datetime
+import online.const as const
+from google_play_scraper import reviews, Sort
+
+DATETIME_FIELDS = ("at", "repliedAt")
+
+def _serialize_item(item: dict) -> dict:
+    return {k: (v.isoformat() if isinstance(v, datetime) else v) for k, v in item.items()}
+
+def deserialize_item(item: dict) -> dict:
+    """기록된 item의 datetime 필드를 scraper가 반환하는 형태로 복원"""
+    out = dict(item)
+    for f in DATETIME_FIELDS:
+        if out.get(f):
+            out[f] = datetime.fromisoformat(out[f])
+    return out
+
+def page_path(record_dir: str, page_no: int) -> str:
+    return os.path.join(record_dir, f"page_{page_no:05d}.json")
+
+def _page_files(record_dir: str) -> list[str]:
+    if not os.path.isdir(record_dir):
+        return []
+    return sorted(name for name in os.listdir(record_dir) if name.startswith("page_") and name.endswith(".json"))
+
+def load_pages(record_dir: str) -> list[dict]:
+    """기록된 page들을 순서대로 로드 (items는 datetime 복원 상태)"""
+    pages = []
+    for name in _page_files(record_dir):
+        with open(os.path.join(record_dir, name), encoding="utf-8") as f:
+            page = json.load(f)
+        page["items"] = [deserialize_item(item) for item in page["items"]]
+        pages.append(page)
+    return pages
+
+def record(record_dir: str = const.RECORD_DIR, max_pages: int = const.MAX_PAGES, sleep_ms: int = 300,
+           force: bool = False):
+    """
+    실제 Play Store 리뷰 page(items + continuation token)를 파일로 기록
+    - interval_ms: 이전 page 시작부터 이번 page 시작까지의 실제 간격 (replay 속도 기준)
+    - 이전 기록이 남아 있으면 replay에 섞이므로 거부, force=True면 기존 page_*.json 삭제 후 기록
+    """
+    existing = _page_files(record_dir)
+    if existing and not force:
+        raise FileExistsError(f"이미 기록된 page가 있습니다: {record_dir} (덮어쓰려면 --force)")
+    for name in existing:
+        os.remove(os.path.join(record_dir, name))
+    os.makedirs(record_dir, exist_ok=True)
+
+    token, total = None, 0
+    prev_start = None
+    for page_no in range(max_pages):
+        start = time.monotonic()
+        items, token = reviews(const.MNT_APP_ID,
+                               lang="ko",
+                               country="kr",
+                               sort=Sort.NEWEST,
+                               count=const.REVIEW_CNT,
+                               continuation_token=token)
+        fetch_ms = (time.monotonic() - start) * 1000
+        interval_ms = 0 if prev_start is None else (start - prev_start) * 1000
+        prev_start = start
+        if not items:
+            break
+
+        page = {
+            "page_no": page_no,
+            "fetch_ms": round(fetch_ms, 3),
+            "interval_ms": round(interval_ms, 3),
+            "token": getattr(token, "token", None),
+            "items": [_serialize_item(item) for item in items],
+        }
+        with open(page_path(record_dir, page_no), "w", encoding="utf-8") as f:
+            json.dump(page, f, ensure_ascii=False)
+        total += len(items)
+        print(f"recorded page={page_no} items={len(items)} total={total}")
+
+        if not token or not getattr(token, "token", None):  # 다음 페이지 없으면 종료
+            break
+
+        time.sleep(sleep_ms / 1000.0)
+
+    return total
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="google play 리뷰 page 기록")
+    parser.add_argument("--dir", default=const.RECORD_DIR)
+    parser.add_argument("--pages", type=int, default=const.MAX_PAGES)
+    parser.add_argument("--force", action="store_true", help="기존 기록(page_*.json)을 지우고 다시 기록")
+    args = parser.parse_args()
+
+    print(f"start record dir={args.dir}")
+    total = record(args.dir, args.pages, force=args.force)
+    print(f"record success dir={args.dir} items={total}")
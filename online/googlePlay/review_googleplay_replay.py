@@ -0,0 +1,88 @@
+import time
+import argparse
+import redis
+import online.const as const
+import online.googlePlay.review_googleplay_ingest as review_googleplay_ingest
+import online.googlePlay.review_googleplay_record as review_googleplay_record
+
+DB = 1  # 운영 데이터(db=0)와 분리된 부하 테스트용 DB
+
+def init_redis(host, port, db):
+    client = redis.StrictRedis(host=host, port=port, db=db, decode_responses=True)
+    return client
+
+def _redis_cpu_seconds(client) -> float:
+    info = client.info("cpu")
+    return float(info.get("used_cpu_sys", 0)) + float(info.get("used_cpu_user", 0))
+
+def _percentile(sorted_values: list[float], pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    idx = min(len(sorted_values) - 1, int(round(pct / 100.0 * (len(sorted_values) - 1))))
+    return sorted_values[idx]
+
+def replay(record_dir: str = const.RECORD_DIR, speed: float = 1.0, db=DB, loops: int = 1) -> dict:
+    """
+    기록된 page를 실제 ingest 경로(review_googleplay_ingest.ingest_item)로 재생
+    - speed: 실제 수집 속도 대비 배수 (2.0 = 2배 빠르게, 0 = 대기 없이 최대 속도)
+    - lag: 일정보다 늦게 시작한 page의 지연 (쓰기 경로의 backpressure, 각 loop의 첫 page 제외)
+    """
+    pages = review_googleplay_record.load_pages(record_dir)
+    if not pages:
+        raise ValueError(f"기록된 page가 없습니다: {record_dir}")
+
+    client = init_redis(host='localhost', port=6379, db=db)
+    cpu_start = _redis_cpu_seconds(client)
+
+    latencies, lags = [], []
+    start = time.monotonic()
+    schedule_s = 0.0
+    for _ in range(loops):
+        for page_no, page in enumerate(pages):
+            if page_no == 0:
+                # 각 loop의 첫 page는 기록된 간격이 없으므로 지금 시점을 일정 기준으로 다시 잡음
+                schedule_s = time.monotonic() - start
+            elif speed > 0:
+                schedule_s += page.get("interval_ms", 0) / 1000.0 / speed
+                wait = schedule_s - (time.monotonic() - start)
+                if wait > 0:
+                    time.sleep(wait)
+                elif wait < 0:
+                    lags.append(-wait)
+
+            for item in page["items"]:
+                t0 = time.perf_counter()
+                review_googleplay_ingest.ingest_item(item, db)
+                latencies.append(time.perf_counter() - t0)
+
+    elapsed = time.monotonic() - start
+    cpu_used = _redis_cpu_seconds(client) - cpu_start
+
+    latencies.sort()
+    return {
+        "pages": len(pages) * loops,
+        "writes": len(latencies),
+        "elapsed_s": round(elapsed, 3),
+        "writes_per_s": round(len(latencies) / elapsed, 1) if elapsed > 0 else 0.0,
+        "latency_p50_ms": round(_percentile(latencies, 50) * 1000, 3),
+        "latency_p95_ms": round(_percentile(latencies, 95) * 1000, 3),
+        "latency_p99_ms": round(_percentile(latencies, 99) * 1000, 3),
+        "latency_max_ms": round((latencies[-1] if latencies else 0) * 1000, 3),
+        "late_pages": len(lags),
+        "lag_max_ms": round(max(lags, default=0) * 1000, 3),
+        "redis_cpu_s": round(cpu_used, 3),
+        "redis_cpu_pct": round(cpu_used / elapsed * 100, 1) if elapsed > 0 else 0.0,
+    }
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="기록된 google play 리뷰 page 재생 (쓰기 경로 부하 테스트)")
+    parser.add_argument("--dir", default=const.RECORD_DIR)
+    parser.add_argument("--speed", type=float, default=1.0, help="실제 속도 대비 배수 (0 = 최대 속도)")
+    parser.add_argument("--db", type=int, default=DB)
+    parser.add_argument("--loops", type=int, default=1)
+    args = parser.parse_args()
+
+    print(f"start replay dir={args.dir} speed={args.speed}x db={args.db}")
+    result = replay(args.dir, args.speed, args.db, args.loops)
+    for k, v in result.items():
+        print(f"{k:>16} : {v}")
@@ -1,6 +1,4 @@
-from datetime import datetime
-import online.common.review_redis_common_insert as review_redis_common_insert
-from online.common.review_redis_common_insert_dto import review_redis_common_insert_dto
+import online.googlePlay.review_googleplay_ingest as review_googleplay_ingest
 from google_play_scraper import app, reviews, Sort
 import online.const as const
 
@@ -24,21 +22,7 @@ def get_review() :
         #✅forDebug
         print(item, "\n")
         
-        review_data = review_redis_common_insert_dto(
-            row_id              = datetime.now().strftime("%Y%m%d%H%M%S%f"),  
-            channel_name        = "google_play",
-            original_id         = "",
-            original_created_at = "",
-            original_content    = item.get("reviewCreatedVersion", ""),
-            reviewer_id         = item.get("reviewId", ""), 
-            reviewer_name       = item.get("userName", ""),      
-            rating              = int(item.get("score", 0)),          
-            review_content      = (item.get("content") or "").strip(),  
-            review_created_at   = item.get("at","").strftime("%Y-%m-%dT%H:%M:%S"),
-            inserted_at         = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        )
-        
-        # review_redis_common_insert 모듈로 insert
-        review_redis_common_insert.insert_review(review_data, DB)
+        # review_googleplay_ingest 모듈로 insert
+        review_googleplay_ingest.ingest_item(item, DB)
     
     
\ No newline at end of file
@@ -15,12 +15,15 @@
 
 import re
 import json
+import time
 import redis
+import threading
 import pandas as pd
 import streamlit as st
 import altair as alt
 import numpy as np
-from datetime import date, timedelta
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from datetime import date, datetime, timedelta
 from dateutil.relativedelta import relativedelta
 
 st.set_page_config(page_title="Feedback Analysis Dashboard", page_icon=":package:", layout="wide")
@@ -44,6 +47,15 @@ DEFAULT_CHANNELS = ["google_play"]
 DELIM = ":"
 SUFFIX_ALL = "*"
 SCAN_COUNT = 1000
+INDEX_PREFIX = "review_idx"  # 채널별 시간 인덱스 (sorted set, score = review_created_at epoch 초)
+INDEX_READY_PREFIX = "review_idx_ready"  # 마이그레이션 완료 표시 (있을 때만 인덱스로 조회)
+TIME_FIELDS = ("review_created_at", "inserted_at")  # schema v2: epoch 초
+DISPLAY_TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+KEY_TIME_FORMAT = "%Y%m%d%H%M%S"
+SCAN_WORKERS = 4  # 채널별 조회 병렬 수 (1이면 순차)
+REDIS_MAX_CONCURRENCY = 4  # 모든 세션을 합친 동시 Redis 조회 상한 (ingest 보호)
+SHARED_RESULT_TTL = 60  # 세션 간 공유하는 채널별 조회 결과 유지 시간(초)
+QUERY_WAIT_TIMEOUT = 120  # 다른 세션의 진행 중 조회를 기다리는 최대 시간(초, 초과 시 직접 조회)
 
 def _get_qp_list(name: str, fallback: list[str]) -> list[str]:
     raw = st.query_params.get(name, ",".join(fallback))
@@ -74,6 +86,35 @@ def scan_all(client: redis.StrictRedis, match_pattern: str, count: int = SCAN_CO
             break
     return all_keys
 
+def _bucket_keys(keys: list[str], channel: str, prefixes: list[str] | None) -> list[str]:
+    """channel의 키 중 요청한 접두사(YYYYMM / YYYYMMDD)에 해당하는 키만 남김"""
+    if prefixes is None:
+        return keys
+    wanted = set(prefixes)
+    lengths = sorted({len(p) for p in wanted})
+    head = len(f"review:{channel}{DELIM}")
+    out = []
+    for k in keys:
+        rest = k[head:]
+        if any(rest[:n] in wanted for n in lengths):
+            out.append(k)
+    return out
+
+def scan_coalesced(client: redis.StrictRedis, channels: list[str], prefixes: list[str] | None,
+                   count: int = SCAN_COUNT) -> list[str]:
+    """
+    채널당 `review:{channel}:*` SCAN 한 번으로 키스페이스를 순회하고,
+    요청한 접두사에 해당하는 키는 클라이언트에서 골라냄.
+    - 접두사마다 전체 SCAN을 반복하던 방식 대비 SCAN 횟수가 패턴 수만큼 줄어듦
+    - 채널 간 병렬화는 run_query에서 수행
+    """
+    out: set[str] = set()
+    for ch in channels:
+        match = f"review:{ch}{DELIM}{SUFFIX_ALL}"
+        print("query : ", match)
+        out.update(_bucket_keys(scan_all(client, match, count=count), ch, prefixes))
+    return sorted(out)
+
 def read_value_by_type(client: redis.StrictRedis, key: str):
     t = client.type(key)
     if t == "string":
@@ -154,6 +195,28 @@ def prefixes_for_horizon(horizon: str, today: date):
 
     return None, False
 
+def _horizon_range(prefixes: list[str] | None) -> tuple[float, float]:
+    """접두사(YYYYMM / YYYYMMDD) 목록이 덮는 기간 → (start_epoch, end_epoch), 로컬 시간 기준 양끝 포함"""
+    if prefixes is None:
+        return float("-inf"), float("inf")
+    if not prefixes:
+        return 0, -1
+    first, last = min(prefixes), max(prefixes)
+    start = datetime.strptime(first, "%Y%m%d" if len(first) == 8 else "%Y%m")
+    end = datetime.strptime(last, "%Y%m%d" if len(last) == 8 else "%Y%m")
+    end += timedelta(days=1) if len(last) == 8 else relativedelta(months=1)
+    return int(start.timestamp()), int(end.timestamp()) - 1
+
+def _epoch_from_key(key: str) -> int | None:
+    """review:{channel}:{YYYYMMDDHHMMSS} 키의 시각 → epoch 초 (인덱스가 없는 v1 데이터용)"""
+    parts = key.split(DELIM, 2)
+    if len(parts) < 3:
+        return None
+    try:
+        return int(datetime.strptime(parts[2][:14], KEY_TIME_FORMAT).timestamp())
+    except ValueError:
+        return None
+
 top_left_cell = cols[0].container(border=True, height="stretch", vertical_alignment="center")
 
 with top_left_cell:
@@ -192,38 +255,134 @@ right_cell = cols[1].container(border=True, height="stretch", vertical_alignment
 today = date.today()
 prefixes, per_day = prefixes_for_horizon(horizon, today)
 
-def build_patterns(channels: list[str], prefixes, per_day: bool, horizon: str | None = None):
-    patterns = []
-    if prefixes is None:
-        for ch in channels:
-            patterns.append(f"review:{ch}{DELIM}{SUFFIX_ALL}")
-        return patterns
-    for ch in channels:
-        for p in prefixes:
-            patterns.append(f"review:{ch}{DELIM}{p}{SUFFIX_ALL}")
-    return patterns
+def _covers(cached: tuple[float, float], wanted: tuple[float, float]) -> bool:
+    """cached 기간(epoch 범위)이 wanted 기간을 포함하는지 (예: 1 Month ⊇ 1 Week)"""
+    return cached[0] <= wanted[0] and wanted[1] <= cached[1]
 
-patterns = build_patterns(channels, prefixes, per_day, horizon=horizon)
+class QueryCoordinator:
+    """
+    세션 간 채널 조회 조정
+    - single-flight: 같은 (채널, 기간) 조회가 진행 중이면 새로 조회하지 않고 결과를 기다림
+    - 결과 공유: 더 넓은 기간의 조회 결과가 있으면 잘라서 사용 (예: 1 Week ← 1 Month)
+    - Redis 조회는 semaphore로 동시 실행 수를 제한
+    """
+    def __init__(self, max_concurrency: int = REDIS_MAX_CONCURRENCY, ttl: float = SHARED_RESULT_TTL,
+                 wait_timeout: float = QUERY_WAIT_TIMEOUT):
+        self.ttl = ttl
+        self.wait_timeout = wait_timeout
+        self._lock = threading.Lock()
+        self._redis_slots = threading.BoundedSemaphore(max_concurrency)
+        self._inflight: dict[tuple, Future] = {}
+        self._results: dict[tuple, tuple[float, list[dict]]] = {}
+
+    def _find_covering(self, channel: str, span: tuple[float, float]):
+        now = time.monotonic()
+        for key, (ts, rows) in list(self._results.items()):
+            if now - ts > self.ttl:
+                del self._results[key]
+        for (ch, cached), (_, rows) in self._results.items():
+            if ch == channel and _covers(cached, span):
+                return rows, cached
+        for (ch, cached), fut in self._inflight.items():
+            if ch == channel and _covers(cached, span):
+                return fut, cached
+        return None, None
+
+    def get(self, channel: str, span: tuple[float, float], loader) -> list[dict]:
+        with self._lock:
+            found, cached = self._find_covering(channel, span)
+            if found is None:
+                fut = Future()
+                self._inflight[(channel, span)] = fut
+                owner = True
+            else:
+                owner = False
+
+        if not owner:
+            # 진행 중 조회는 wait_timeout까지만 기다리고, 초과하면 직접 조회 (semaphore 적용, 결과 공유 안 함)
+            try:
+                rows = found.result(timeout=self.wait_timeout) if isinstance(found, Future) else found
+            except FutureTimeoutError:
+                with self._redis_slots:
+                    return loader()
+            if cached == span:
+                return rows
+            return [r for r in rows if span[0] <= r["ts"] <= span[1]]
+
+        rows, error = None, None
+        try:
+            with self._redis_slots:
+                rows = loader()
+            return rows
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            # KeyboardInterrupt 등으로 빠져나가도 in-flight 항목을 정리해 대기자가 멈추지 않게 함
+            with self._lock:
+                del self._inflight[(channel, span)]
+                if error is None:
+                    self._results[(channel, span)] = (time.monotonic(), rows)
+            if error is None:
+                fut.set_result(rows)
+            elif isinstance(error, Exception):
+                fut.set_exception(error)
+            else:
+                fut.set_exception(RuntimeError(f"query aborted: {channel}"))
 
-@st.cache_data(show_spinner=False)
-def run_query(patterns: list[str]):
-    client = get_client()
-    all_keys = []
-    for p in patterns:
-        print("query : ", p)
-        all_keys.extend(scan_all(client, p, count=SCAN_COUNT))
-    all_keys = sorted(set(all_keys))
-
-    rows, type_counter, error_count = [], {}, 0
-    for k in all_keys:
+@st.cache_resource(show_spinner=False)
+def get_query_coordinator() -> QueryCoordinator:
+    return QueryCoordinator()
+
+def _load_channel_rows(client: redis.StrictRedis, channel: str, span: tuple[float, float],
+                       prefixes: list[str] | None) -> list[dict]:
+    """
+    channel의 기간(span) 내 리뷰 조회
+    - 마이그레이션 완료 표시(review_idx_ready:{channel})가 있으면 시간 인덱스를 ZRANGEBYSCORE로 범위 조회
+    - 없으면(마이그레이션 전/진행 중) 인덱스가 일부만 채워져 있으므로 SCAN + 접두사 필터로 대체
+    """
+    index_key = f"{INDEX_PREFIX}{DELIM}{channel}"
+    if client.exists(f"{INDEX_READY_PREFIX}{DELIM}{channel}"):
+        print("query : ", index_key, span)
+        pairs = client.zrangebyscore(index_key, span[0], span[1], withscores=True)
+    else:
+        pairs = [(k, _epoch_from_key(k)) for k in scan_coalesced(client, [channel], prefixes, count=SCAN_COUNT)]
+
+    rows = []
+    for k, ts in pairs:
+        if ts is None:
+            continue
         try:
             t = client.type(k)
             v = read_value_by_type(client, k)
-            rows.append({"key": k, "type": t, "value": v})
-            type_counter[t] = type_counter.get(t, 0) + 1
+            rows.append({"key": k, "channel": channel, "ts": int(ts), "type": t, "value": v})
         except Exception as e:
-            rows.append({"key": k, "type": "error", "value": f"⚠️ {e}"})
+            rows.append({"key": k, "channel": channel, "ts": int(ts), "type": "error", "value": f"⚠️ {e}"})
+    return rows
+
+@st.cache_data(show_spinner=False, ttl=SHARED_RESULT_TTL)
+def run_query(channels: list[str], prefixes: list[str] | None):
+    client = get_client()
+    coordinator = get_query_coordinator()
+    span = _horizon_range(prefixes)
+
+    def _query_channel(ch: str) -> list[dict]:
+        return coordinator.get(ch, span, lambda: _load_channel_rows(client, ch, span, prefixes))
+
+    if SCAN_WORKERS > 1 and len(channels) > 1:
+        with ThreadPoolExecutor(max_workers=min(SCAN_WORKERS, len(channels))) as ex:
+            per_channel = list(ex.map(_query_channel, channels))
+    else:
+        per_channel = [_query_channel(ch) for ch in channels]
+
+    rows = sorted({r["key"]: r for ch_rows in per_channel for r in ch_rows}.values(), key=lambda r: r["key"])
+    all_keys = [r["key"] for r in rows]
+    type_counter, error_count = {}, 0
+    for r in rows:
+        if r["type"] == "error":
             error_count += 1
+        else:
+            type_counter[r["type"]] = type_counter.get(r["type"], 0) + 1
     df = pd.DataFrame(rows)
     return all_keys, df, type_counter, error_count
 
@@ -282,35 +441,22 @@ def build_month_series_from_values_for_all(df: pd.DataFrame, channels: list[str]
     )
 
 # ---- 접두사(YYYYMM / YYYYMMDD)별 집계 (per_day에 맞춤) ----
-def build_prefix_series(keys: list[str], per_day: bool, prefixes: list[str] | None) -> pd.DataFrame:
+def build_prefix_series(df: pd.DataFrame, per_day: bool) -> pd.DataFrame:
     """
+    review_created_at epoch(ts 컬럼)를 기준으로 집계
     반환: Prefix(str), Channel(str), Count(int)
     - per_day=True  -> YYYYMMDD 단위
     - per_day=False -> YYYYMM 단위
     """
-    if not keys:
+    if df is None or df.empty or "ts" not in df.columns:
         return pd.DataFrame(columns=["Prefix", "Channel", "Count"])
 
-    pat = re.compile(r"^(\d{8})" if per_day else r"^(\d{6})")
-    rows = []
-    for k in keys:
-        parts = k.split(DELIM, 2)  # ["review", "{channel}", "{rest}"]
-        if len(parts) < 3:
-            continue
-        ch, rest = parts[1], parts[2]
-
-        m = pat.match(rest)
-        if not m:
-            continue
-
-        prefix = m.group(1)  # YYYYMMDD or YYYYMM
-        rows.append({"Prefix": prefix, "Channel": ch})
-
-    if not rows:
-        return pd.DataFrame(columns=["Prefix", "Channel", "Count"])
-
-    dfp = pd.DataFrame(rows).groupby(["Prefix", "Channel"]).size().reset_index(name="Count")
-    return dfp
+    fmt = "%Y%m%d" if per_day else "%Y%m"
+    dfp = pd.DataFrame({
+        "Prefix": [datetime.fromtimestamp(ts).strftime(fmt) for ts in df["ts"]],
+        "Channel": df["channel"],
+    })
+    return dfp.groupby(["Prefix", "Channel"]).size().reset_index(name="Count")
 
 # ---- 표시용 안전 문자열화 ----
 INT64_MIN = -(2**63)
@@ -345,6 +491,16 @@ def _stringify_for_grid(v):
     except Exception:
         pass
     return v
+def _format_time_fields(v):
+    """schema v2의 epoch 초 시각 필드를 로컬 YYYY-MM-DD HH:MM:SS로 표시"""
+    if not isinstance(v, dict):
+        return v
+    out = dict(v)
+    for f in TIME_FIELDS:
+        raw = out.get(f)
+        if isinstance(raw, int) and not isinstance(raw, bool) and len(str(raw)) == 10:
+            out[f] = datetime.fromtimestamp(raw).strftime(DISPLAY_TIME_FORMAT)
+    return out
 def make_display_df(df: pd.DataFrame) -> pd.DataFrame:
     out = df.copy()
     if "key" in out.columns:
@@ -352,7 +508,7 @@ def make_display_df(df: pd.DataFrame) -> pd.DataFrame:
     if "type" in out.columns:
         out["type"] = out["type"].astype(str)
     if "value" in out.columns:
-        out["value"] = out["value"].apply(_stringify_for_grid)
+        out["value"] = out["value"].apply(lambda v: _stringify_for_grid(_format_time_fields(v)))
     return out
 
 # ---- 데이터 로드 & 그래프 ----
@@ -361,17 +517,17 @@ with right_cell:
     # if horizon == "All" and prefixes:
     #     st.caption(f"⏱ 기간: **All** – 사용 패턴: `{prefixes[0]}*` … `{prefixes[-1]}*` (총 {len(prefixes)}개)")
     # else:
-    #     st.caption("🔍 사용 패턴: " + ", ".join(f"`{p}`" for p in patterns))
+    #     st.caption("🔍 사용 채널: " + ", ".join(f"`{ch}`" for ch in channels))
 
     with st.spinner("Redis에서 데이터를 가져오는 중..."):
-        keys, df, type_counter, error_count = run_query(patterns)
+        keys, df, type_counter, error_count = run_query(channels, prefixes)
 
     if not keys:
         st.warning("해당 조건에 맞는 키가 없습니다.")
         st.stop()
 
     # === 그래프 ===
-    series_df = build_prefix_series(keys, per_day=per_day, prefixes=prefixes)
+    series_df = build_prefix_series(df, per_day=per_day)
 
     # All일 때는 '기간에 해당하는 접두사가 없습니다' 문구 출력하지 않음
     if horizon != "All" and not prefixes:
@@ -455,7 +611,7 @@ def _reorder_columns(df: pd.DataFrame, preferred: list[str], sort_remaining: boo
 def _safe_stringify(obj):
     """dict/list 내부까지 순회하며 표시 안전한 값으로 변환(초대형 정수 → 문자열 등)."""
     if isinstance(obj, dict):
-        return {k: _safe_stringify(v) for k, v in obj.items()}
+        return {k: _safe_stringify(v) for k, v in _format_time_fields(obj).items()}
     if isinstance(obj, list):
         return [_safe_stringify(x) for x in obj]
     # 스칼라 타입은 기존 유틸 사용